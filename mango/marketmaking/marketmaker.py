@@ -52,7 +52,7 @@ class MarketMaker:
 
     def pulse(self, context: mango.Context, model_state: mango.ModelState) -> None:
         try:
-            self._logger.debug(f"[{context.name}] Pulse started with oracle price:\n    {model_state.price}")
+            self._logger.debug("[%s] Pulse started with oracle price:\n    %s", context.name, model_state.price)
 
             payer = mango.CombinableInstructions.from_wallet(self.wallet)
 
@@ -68,11 +68,16 @@ class MarketMaker:
                 self._logger.info(f"[{context.name}] Market-maker not quoting - model_state.not_quoting is set.")
                 return
 
+            # Formatting every order is only worth doing if it's going to be logged.
+            debug_enabled: bool = self._logger.isEnabledFor(logging.DEBUG)
+
             existing_orders = model_state.current_orders()
-            self._logger.debug(f"""Before reconciliation: all owned orders on current orderbook [{model_state.market.symbol}]:
+            if debug_enabled:
+                self._logger.debug(f"""Before reconciliation: all owned orders on current orderbook [{model_state.market.symbol}]:
     {mango.indent_collection_as_str(existing_orders)}""")
             reconciled = self.order_reconciler.reconcile(model_state, existing_orders, desired_orders)
-            self._logger.debug(f"""After reconciliation
+            if debug_enabled:
+                self._logger.debug(f"""After reconciliation
 Keep:
     {mango.indent_collection_as_str(reconciled.to_keep)}
 Cancel:
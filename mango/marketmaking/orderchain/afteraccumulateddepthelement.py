@@ -79,14 +79,14 @@ class AfterAccumulatedDepthElement(Element):
                     new_price = place_above.price + adjustment
 
             if new_price is None:
-                self._logger.debug(f"""Order change - no acceptable depth for quantity {depth} so removing:
-    Old: {order}
-    New: None""")
+                self._logger.debug("""Order change - no acceptable depth for quantity %s so removing:
+    Old: %s
+    New: None""", depth, order)
             else:
                 new_order: mango.Order = order.with_price(new_price)
-                self._logger.debug(f"""Order change - accumulated depth of {depth} is {self.adjustment_ticks} tick from {new_price}:
-    Old: {order}
-    New: {new_order}""")
+                self._logger.debug("""Order change - accumulated depth of %s is %s tick from %s:
+    Old: %s
+    New: %s""", depth, self.adjustment_ticks, new_price, order, new_order)
                 new_orders += [new_order]
 
         return new_orders
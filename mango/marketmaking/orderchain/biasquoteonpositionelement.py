@@ -77,9 +77,9 @@ class BiasQuoteOnPositionElement(PairwiseElement):
         new_price: Decimal = order.price * bias
         new_order: mango.Order = order.with_price(new_price)
         bias_description = "BUY more" if bias > 1 else "SELL more"
-        self._logger.debug(f"""Order change - bias {inventory_bias} on inventory {base_inventory_value} / {order.quantity} creates a ({bias_description}) bias factor of {bias}:
-    Old: {order}
-    New: {new_order}""")
+        self._logger.debug("""Order change - bias %s on inventory %s / %s creates a (%s) bias factor of %s:
+    Old: %s
+    New: %s""", inventory_bias, base_inventory_value, order.quantity, bias_description, bias, order, new_order)
         return new_order
 
     def __str__(self) -> str:
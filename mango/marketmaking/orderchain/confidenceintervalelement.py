@@ -14,6 +14,7 @@
 #   [Email](mailto:hello@blockworks.foundation)
 
 import argparse
+import logging
 import mango
 import typing
 
@@ -73,18 +74,21 @@ class ConfidenceIntervalElement(Element):
                                                     quantity=position_size, order_type=self.order_type)
             ask_order = mango.Order.from_basic_info(mango.Side.SELL, price=ask,
                                                     quantity=position_size, order_type=self.order_type)
-            self._logger.debug(f"""Desired orders:
-    Bid: {bid_order}
-    Ask: {ask_order}""")
+            self._logger.debug("""Desired orders:
+    Bid: %s
+    Ask: %s""", bid_order, ask_order)
             new_orders += [bid_order, ask_order]
 
         new_orders.sort(key=lambda ord: ord.price, reverse=True)
-        order_text = "\n    ".join([f"{order}" for order in new_orders])
 
-        top_bid = model_state.top_bid
-        top_ask = model_state.top_ask
-        self._logger.debug(f"""Initial desired orders - spread {model_state.spread} ({top_bid.price if top_bid else None} / {top_ask.price if top_ask else None}):
-    {order_text}""")
+        # Only worth gathering all this up if it's going to be logged.
+        if self._logger.isEnabledFor(logging.DEBUG):
+            order_text = "\n    ".join([f"{order}" for order in new_orders])
+            top_bid = model_state.top_bid
+            top_ask = model_state.top_ask
+            self._logger.debug("""Initial desired orders - spread %s (%s / %s):
+    %s""", model_state.spread, top_bid.price if top_bid else None, top_ask.price if top_ask else None, order_text)
+
         return new_orders
 
     def __str__(self) -> str:
@@ -53,15 +53,15 @@ class FixedPositionSizeElement(PairwiseElement):
         new_sell: typing.Optional[mango.Order] = None
         if buy is not None:
             new_buy = buy.with_quantity(size)
-            self._logger.debug(f"""Order change - using fixed position size of {size}:
-    Old: {buy}
-    New: {new_buy}""")
+            self._logger.debug("""Order change - using fixed position size of %s:
+    Old: %s
+    New: %s""", size, buy, new_buy)
 
         if sell is not None:
             new_sell = sell.with_quantity(size)
-            self._logger.debug(f"""Order change - using fixed position size of {size}:
-    Old: {sell}
-    New: {new_sell}""")
+            self._logger.debug("""Order change - using fixed position size of %s:
+    Old: %s
+    New: %s""", size, sell, new_sell)
 
         return new_buy, new_sell
 
@@ -56,16 +56,16 @@ class FixedSpreadElement(PairwiseElement):
         if buy is not None:
             new_buy_price: Decimal = price.mid_price - half_spread
             new_buy = buy.with_price(new_buy_price)
-            self._logger.debug(f"""Order change - using fixed spread of {spread:,.8f} - new BUY price {new_buy_price:,.8f} is {half_spread:,.8f} from mid price {price.mid_price:,.8f}:
-    Old: {buy}
-    New: {new_buy}""")
+            self._logger.debug("""Order change - using fixed spread of %s - new BUY price %s is %s from mid price %s:
+    Old: %s
+    New: %s""", spread, new_buy_price, half_spread, price.mid_price, buy, new_buy)
 
         if sell is not None:
             new_sell_price: Decimal = price.mid_price + half_spread
             new_sell = sell.with_price(new_sell_price)
-            self._logger.debug(f"""Order change - using fixed spread of {spread:,.8f} - new SELL price {new_sell_price:,.8f} is {half_spread:,.8f} from mid price {price.mid_price:,.8f}:
-    Old: {sell}
-    New: {new_sell}""")
+            self._logger.debug("""Order change - using fixed spread of %s - new SELL price %s is %s from mid price %s:
+    Old: %s
+    New: %s""", spread, new_sell_price, half_spread, price.mid_price, sell, new_sell)
 
         return new_buy, new_sell
 
@@ -56,14 +56,14 @@ class MaximumQuantityElement(Element):
                 new_orders += [order]
             else:
                 if self.remove:
-                    self._logger.debug(f"""Order change - order quantity is greater than maximum of {self.maximum_quantity} so removing:
-    Old: {order}
-    New: None""")
+                    self._logger.debug("""Order change - order quantity is greater than maximum of %s so removing:
+    Old: %s
+    New: None""", self.maximum_quantity, order)
                 else:
                     new_order: mango.Order = order.with_quantity(self.maximum_quantity)
-                    self._logger.debug(f"""Order change - order quantity is greater than maximum of {self.maximum_quantity} so changing order quantity to {self.maximum_quantity}:
-    Old: {order}
-    New: {new_order}""")
+                    self._logger.debug("""Order change - order quantity is greater than maximum of %s so changing order quantity to %s:
+    Old: %s
+    New: %s""", self.maximum_quantity, self.maximum_quantity, order, new_order)
                     new_orders += [new_order]
 
         return new_orders
@@ -72,9 +72,9 @@ class MinimumChargeElement(PairwiseElement):
             if current_charge < minimum_charge:
                 new_price = measurement_price - minimum_charge
                 new_buy = buy.with_price(new_price)
-                self._logger.debug(f"""Order change - old BUY price {buy.price:,.8f} distance from {measurement_price:,.8f} would return {current_charge:,.8f} which is less than minimum charge {minimum_charge:,.8f}:
-    Old: {buy}
-    New: {new_buy}""")
+                self._logger.debug("""Order change - old BUY price %s distance from %s would return %s which is less than minimum charge %s:
+    Old: %s
+    New: %s""", buy.price, measurement_price, current_charge, minimum_charge, buy, new_buy)
 
         if sell is not None:
             measurement_price = model_state.price.top_ask if self.minimumcharge_from_bid_ask else model_state.price.mid_price
@@ -83,9 +83,9 @@ class MinimumChargeElement(PairwiseElement):
             if current_charge < minimum_charge:
                 new_price = measurement_price + minimum_charge
                 new_sell = sell.with_price(new_price)
-                self._logger.debug(f"""Order change - old SELL price {sell.price:,.8f} distance from {measurement_price:,.8f} would return {current_charge:,.8f} which is less than minimum charge {minimum_charge:,.8f}:
-    Old: {sell}
-    New: {new_sell}""")
+                self._logger.debug("""Order change - old SELL price %s distance from %s would return %s which is less than minimum charge %s:
+    Old: %s
+    New: %s""", sell.price, measurement_price, current_charge, minimum_charge, sell, new_sell)
 
         return new_buy, new_sell
 
@@ -56,14 +56,14 @@ class MinimumQuantityElement(Element):
                 new_orders += [order]
             else:
                 if self.remove:
-                    self._logger.debug(f"""Order change - order quantity is less than minimum of {self.minimum_quantity} so removing:
-    Old: {order}
-    New: None""")
+                    self._logger.debug("""Order change - order quantity is less than minimum of %s so removing:
+    Old: %s
+    New: None""", self.minimum_quantity, order)
                 else:
                     new_order: mango.Order = order.with_quantity(self.minimum_quantity)
-                    self._logger.debug(f"""Order change - order quantity is less than minimum of {self.minimum_quantity} so changing order quantity to {self.minimum_quantity}:
-    Old: {order}
-    New: {new_order}""")
+                    self._logger.debug("""Order change - order quantity is less than minimum of %s so changing order quantity to %s:
+    Old: %s
+    New: %s""", self.minimum_quantity, self.minimum_quantity, order, new_order)
                     new_orders += [new_order]
 
         return new_orders
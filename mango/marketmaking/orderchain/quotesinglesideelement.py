@@ -44,12 +44,12 @@ class QuoteSingleSideElement(Element):
         new_orders: typing.List[mango.Order] = []
         for order in orders:
             if order.side == self.allowed:
-                self._logger.debug(f"""Allowing {order.side} order [allowed: {self.allowed}]:
-    Allowed: {order}""")
+                self._logger.debug("""Allowing %s order [allowed: %s]:
+    Allowed: %s""", order.side, self.allowed, order)
                 new_orders += [order]
             else:
-                self._logger.debug(f"""Removing {order.side} order [allowed: {self.allowed}]:
-    Removed: {order}""")
+                self._logger.debug("""Removing %s order [allowed: %s]:
+    Removed: %s""", order.side, self.allowed, order)
 
         return new_orders
 
@@ -72,15 +72,15 @@ class TopOfBookElement(Element):
                     new_price = place_below.price - adjustment
 
             if new_price is None:
-                self._logger.debug(f"""Order change - no acceptable price from anyone else so leaving it as it is:
-    Old: {order}
-    New: {order}""")
+                self._logger.debug("""Order change - no acceptable price from anyone else so leaving it as it is:
+    Old: %s
+    New: %s""", order, order)
                 new_orders += [order]
             else:
                 new_order: mango.Order = order.with_price(new_price)
-                self._logger.debug(f"""Order change - top of book from others is {self.adjustment_ticks} tick from {new_price}:
-    Old: {order}
-    New: {new_order}""")
+                self._logger.debug("""Order change - top of book from others is %s tick from %s:
+    Old: %s
+    New: %s""", self.adjustment_ticks, new_price, order, new_order)
                 new_orders += [new_order]
 
         return new_orders
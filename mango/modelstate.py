@@ -14,7 +14,6 @@
 #   [Email](mailto:hello@blockworks.foundation)
 
 
-import logging
 import typing
 
 from decimal import Decimal
@@ -43,9 +42,8 @@ class ModelState:
                  price_watcher: Watcher[Price],
                  placed_orders_container_watcher: Watcher[PlacedOrdersContainer],
                  inventory_watcher: Watcher[Inventory],
-                 orderbook: Watcher[OrderBook]
+                 orderbook_watcher: Watcher[OrderBook]
                  ) -> None:
-        self._logger: logging.Logger = logging.getLogger(self.__class__.__name__)
         self.order_owner: PublicKey = order_owner
         self.market: Market = market
         self.group_watcher: Watcher[Group] = group_watcher
@@ -54,11 +52,17 @@ class ModelState:
         self.placed_orders_container_watcher: Watcher[
             PlacedOrdersContainer] = placed_orders_container_watcher
         self.inventory_watcher: Watcher[Inventory] = inventory_watcher
-        self.orderbook_watcher: Watcher[OrderBook] = orderbook
+        self.orderbook_watcher: Watcher[OrderBook] = orderbook_watcher
 
         self.not_quoting: bool = False
         self.state: typing.Dict[str, typing.Any] = {}
 
+        # The orderbook watcher replaces the bids and asks lists whenever the book changes, so the
+        # owner's orders only need to be filtered again when either list is a different object.
+        self.__current_orders_bids: typing.Optional[typing.Sequence[Order]] = None
+        self.__current_orders_asks: typing.Optional[typing.Sequence[Order]] = None
+        self.__current_orders: typing.Sequence[Order] = []
+
     @property
     def group(self) -> Group:
         return self.group_watcher.latest
@@ -106,9 +110,15 @@ class ModelState:
         return self.orderbook.spread
 
     def current_orders(self) -> typing.Sequence[Order]:
-        self.orderbook
-        all_orders = [*self.bids, *self.asks]
-        return list([o for o in all_orders if o.owner == self.order_owner])
+        orderbook: OrderBook = self.orderbook_watcher.latest
+        bids: typing.Sequence[Order] = orderbook.bids
+        asks: typing.Sequence[Order] = orderbook.asks
+        if bids is not self.__current_orders_bids or asks is not self.__current_orders_asks:
+            order_owner: PublicKey = self.order_owner
+            self.__current_orders = [o for o in [*bids, *asks] if o.owner == order_owner]
+            self.__current_orders_bids = bids
+            self.__current_orders_asks = asks
+        return self.__current_orders
 
     def __str__(self) -> str:
         return f"""« ModelState for market '{self.market.symbol}'
@@ -13,6 +13,8 @@
 #   [Github](https://github.com/blockworks-foundation)
 #   [Email](mailto:hello@blockworks.foundation)
 
+import typing
+
 from .context import Context
 from .contextbuilder import ContextBuilder
 from .oracle import OracleProvider
@@ -26,20 +28,22 @@ from .oracles.stub import stub
 #
 # This file allows you to create a concreate OracleProvider for a specified provider name.
 #
+# Each (upper-case) provider name maps to a function that builds its `OracleProvider` from a `Context`.
+#
+_ORACLE_PROVIDER_BUILDERS: typing.Dict[str, typing.Callable[[Context], OracleProvider]] = {
+    "FTX": lambda _: ftx.FtxOracleProvider(),
+    "MARKET": lambda _: market.MarketOracleProvider(),
+    "PYTH": lambda context: pythnetwork.PythOracleProvider(context),
+    "PYTH-MAINNET": lambda context: pythnetwork.PythOracleProvider(ContextBuilder.forced_to_mainnet_beta(context)),
+    "PYTH-DEVNET": lambda context: pythnetwork.PythOracleProvider(ContextBuilder.forced_to_devnet(context)),
+    "STUB": lambda _: stub.StubOracleProvider(),
+}
+
+
 def create_oracle_provider(context: Context, provider_name: str) -> OracleProvider:
     proper_provider_name: str = provider_name.upper()
-    if proper_provider_name == "FTX":
-        return ftx.FtxOracleProvider()
-    elif proper_provider_name == "MARKET":
-        return market.MarketOracleProvider()
-    elif proper_provider_name == "PYTH":
-        return pythnetwork.PythOracleProvider(context)
-    elif proper_provider_name == "PYTH-MAINNET":
-        mainnet_beta_pyth_context: Context = ContextBuilder.forced_to_mainnet_beta(context)
-        return pythnetwork.PythOracleProvider(mainnet_beta_pyth_context)
-    elif proper_provider_name == "PYTH-DEVNET":
-        devnet_pyth_context: Context = ContextBuilder.forced_to_devnet(context)
-        return pythnetwork.PythOracleProvider(devnet_pyth_context)
-    elif proper_provider_name == "STUB":
-        return stub.StubOracleProvider()
-    raise Exception(f"Unknown oracle provider '{proper_provider_name}'.")
+    builder: typing.Optional[typing.Callable[[Context], OracleProvider]] = _ORACLE_PROVIDER_BUILDERS.get(
+        proper_provider_name)
+    if builder is None:
+        raise Exception(f"Unknown oracle provider '{proper_provider_name}'.")
+    return builder(context)
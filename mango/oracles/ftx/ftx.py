@@ -15,7 +15,6 @@
 
 
 import requests
-import re
 import rx
 import typing
 import websocket
@@ -35,8 +34,14 @@ from ...reconnectingwebsocket import ReconnectingWebsocket
 #
 # This file contains code specific to the [Ftx Network](https://ftx.com/).
 #
+# All HTTP requests share one session so repeated fetches reuse the same pooled connection instead of
+# setting up a new TCP and TLS connection each time.
+#
+_ftx_session: requests.Session = requests.Session()
+
+
 def _ftx_get_from_url(url: str) -> typing.Any:
-    response = requests.get(url)
+    response = _ftx_session.get(url)
     response_values = response.json()
     if ("success" not in response_values) or (not response_values["success"]):
         raise Exception(f"Failed to get from FTX URL: {url} - {response_values}")
@@ -49,6 +54,9 @@ def _ftx_get_from_url(url: str) -> typing.Any:
 #
 FtxOracleConfidence: Decimal = Decimal(0)
 
+# Divisor for the streamed mid price, created once rather than on every ticker update.
+_TWO: Decimal = Decimal(2)
+
 
 # # 🥭 FtxOracle class
 #
@@ -74,15 +82,19 @@ class FtxOracle(Oracle):
     def to_streaming_observable(self, _: Context) -> rx.core.typing.Observable[Price]:
         subject = Subject()
 
+        # These don't change between ticks, so look them up once rather than on every update.
+        source: OracleSource = self.source
+        market: Market = self.market
+        publish = subject.on_next
+
         def _on_item(data: typing.Dict[str, typing.Any]) -> None:
             if data["type"] == "update":
-                bid = Decimal(data["data"]["bid"])
-                ask = Decimal(data["data"]["ask"])
-                mid = (bid + ask) / Decimal(2)
-                time = data["data"]["time"]
-                timestamp = datetime.fromtimestamp(time)
-                price = Price(self.source, timestamp, self.market, bid, mid, ask, FtxOracleConfidence)
-                subject.on_next(price)
+                ticker = data["data"]
+                bid = Decimal(ticker["bid"])
+                ask = Decimal(ticker["ask"])
+                mid = (bid + ask) / _TWO
+                timestamp = datetime.fromtimestamp(ticker["time"])
+                publish(Price(source, timestamp, market, bid, mid, ask, FtxOracleConfidence))
 
         def on_open(sock: websocket.WebSocketApp) -> None:
             sock.send(f"""{{"op": "subscribe", "channel": "ticker", "market": "{self.ftx_symbol}"}}""")
@@ -91,9 +103,12 @@ class FtxOracle(Oracle):
         ws.item.subscribe(on_next=_on_item)  # type: ignore[call-arg]
 
         def subscribe(observer: rx.core.typing.Observer[Price], scheduler_: typing.Optional[rx.core.typing.Scheduler] = None) -> rx.core.typing.Disposable:
-            subject.subscribe(observer, scheduler=scheduler_)  # type: ignore
+            subscription = subject.subscribe(observer, scheduler=scheduler_)  # type: ignore
 
+            # Unsubscribe the observer from the subject first, so disposing it doesn't leave the
+            # observer attached to (and kept alive by) the subject.
             disposable = DisposePropagator()
+            disposable.add_disposable(subscription)
             disposable.add_disposable(DisposeWrapper(lambda: ws.close()))
             disposable.add_disposable(DisposeWrapper(lambda: subject.dispose()))
 
@@ -121,15 +136,10 @@ class FtxOracleProvider(OracleProvider):
 
     def all_available_symbols(self, context: Context) -> typing.Sequence[str]:
         result = _ftx_get_from_url("https://ftx.com/api/markets")
-        symbols: typing.List[str] = []
-        for market in result:
-            symbol: str = market["name"]
-            if symbol.endswith("USD"):
-                symbol = f"{symbol}C"
-            symbols += [symbol]
-
-        return symbols
+        return [f"{market['name']}C" if market["name"].endswith("USD") else market["name"] for market in result]
 
     def _market_symbol_to_ftx_symbol(self, symbol: str) -> str:
         normalised = symbol.upper()
-        return re.sub("USDC$", "USD", normalised)
+        if normalised.endswith("USDC"):
+            return normalised[:-1]
+        return normalised
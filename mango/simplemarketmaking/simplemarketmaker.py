@@ -23,6 +23,7 @@ import typing
 from datetime import timedelta
 from decimal import Decimal
 from pathlib import Path
+from solana.publickey import PublicKey
 
 
 # # 🥭 SimpleMarketMaker class
@@ -51,10 +52,9 @@ from pathlib import Path
 #   lot size
 # * The strategy of placing orders at a fixed spread around the mid price without taking any other factors
 #   into account is likely to be costly
-# * Place and Cancel instructions aren't batched into single transactions
 #
 class SimpleMarketMaker:
-    def __init__(self, context: mango.Context, wallet: mango.Wallet, market: mango.SerumMarket, market_operations: mango.MarketOperations, oracle: mango.Oracle, spread_ratio: Decimal, position_size_ratio: Decimal, existing_order_tolerance: Decimal, pause: timedelta) -> None:
+    def __init__(self, context: mango.Context, wallet: mango.Wallet, market: mango.SerumMarket, market_operations: mango.MarketOperations, oracle: mango.Oracle, spread_ratio: Decimal, position_size_ratio: Decimal, existing_order_tolerance: Decimal, pause: timedelta, market_instruction_builder: mango.MarketInstructionBuilder) -> None:
         self._logger: logging.Logger = logging.getLogger(self.__class__.__name__)
         self.context: mango.Context = context
         self.wallet: mango.Wallet = wallet
@@ -65,6 +65,7 @@ class SimpleMarketMaker:
         self.position_size_ratio: Decimal = position_size_ratio
         self.existing_order_tolerance: Decimal = existing_order_tolerance
         self.pause: timedelta = pause
+        self.market_instruction_builder: mango.MarketInstructionBuilder = market_instruction_builder
         self.stop_requested = False
         self.health_filename = "/var/tmp/mango_healthcheck_simple_market_maker"
 
@@ -79,40 +80,49 @@ class SimpleMarketMaker:
             try:
                 # Update current state
                 price = self.oracle.fetch_price(self.context)
-                self._logger.info(f"Price is: {price}")
+                self._logger.info("Price is: %s", price)
                 inventory = self.fetch_inventory()
 
                 # Calculate what we want the orders to be.
                 bid, ask = self.calculate_order_prices(price)
                 buy_quantity, sell_quantity = self.calculate_order_quantities(price, inventory)
 
-                current_orders = self.market_operations.load_my_orders()
-                buy_orders = [order for order in current_orders if order.side == mango.Side.BUY]
+                # All the cancels and places for this iteration are gathered up and sent together, rather
+                # than waiting on a separate transaction for each one.
+                changes = mango.CombinableInstructions.empty()
+
+                buy_orders: typing.List[mango.Order] = []
+                sell_orders: typing.List[mango.Order] = []
+                for order in self.market_operations.load_my_orders():
+                    if order.side == mango.Side.BUY:
+                        buy_orders.append(order)
+                    else:
+                        sell_orders.append(order)
+
                 if self.orders_require_action(buy_orders, bid, buy_quantity):
                     self._logger.info("Cancelling BUY orders.")
-                    for order in buy_orders:
-                        self.market_operations.cancel_order(order)
+                    changes += self.build_cancel_orders_instructions(buy_orders)
                     buy_order: mango.Order = mango.Order.from_basic_info(
                         mango.Side.BUY, bid, buy_quantity, mango.OrderType.POST_ONLY)
-                    self.market_operations.place_order(buy_order)
+                    changes += self.build_place_order_instructions(buy_order)
 
-                sell_orders = [order for order in current_orders if order.side == mango.Side.SELL]
                 if self.orders_require_action(sell_orders, ask, sell_quantity):
                     self._logger.info("Cancelling SELL orders.")
-                    for order in sell_orders:
-                        self.market_operations.cancel_order(order)
+                    changes += self.build_cancel_orders_instructions(sell_orders)
                     sell_order: mango.Order = mango.Order.from_basic_info(
                         mango.Side.SELL, ask, sell_quantity, mango.OrderType.POST_ONLY)
-                    self.market_operations.place_order(sell_order)
+                    changes += self.build_place_order_instructions(sell_order)
+
+                self.execute_changes(changes)
 
                 self.update_health_on_successful_iteration()
             except Exception as exception:
-                self._logger.warning(
-                    f"Pausing and continuing after problem running market-making iteration: {exception} - {traceback.format_exc()}")
+                self._logger.warning("Pausing and continuing after problem running market-making iteration: %s - %s",
+                                     exception, traceback.format_exc())
 
             # Wait and hope for fills.
-            self._logger.info(f"Pausing for {self.pause} seconds.")
-            time.sleep(self.pause.seconds)
+            self._logger.info("Pausing for %s seconds.", self.pause)
+            time.sleep(self.pause.total_seconds())
 
         self._logger.info("Stopped.")
 
@@ -126,8 +136,42 @@ class SimpleMarketMaker:
     def cleanup(self) -> None:
         self._logger.info("Cleaning up.")
         orders = self.market_operations.load_my_orders()
+        self.execute_changes(self.build_cancel_orders_instructions(orders))
+
+    def build_cancel_orders_instructions(self, orders: typing.Sequence[mango.Order]) -> mango.CombinableInstructions:
+        cancellations = mango.CombinableInstructions.empty()
         for order in orders:
-            self.market_operations.cancel_order(order)
+            self._logger.info("Cancelling %s order %s.", self.market.symbol, order)
+            cancellations += self.market_instruction_builder.build_cancel_order_instructions(order)
+        return cancellations
+
+    def build_place_order_instructions(self, order: mango.Order) -> mango.CombinableInstructions:
+        order_with_client_id: mango.Order = order.with_client_id(self.context.generate_client_id())
+        self._logger.info("Placing %s order %s.", self.market.symbol, order_with_client_id)
+        return self.market_instruction_builder.build_place_order_instructions(order_with_client_id)
+
+    def execute_changes(self, changes: mango.CombinableInstructions) -> None:
+        # Don't bother if we have no orders to change
+        if len(changes.instructions) == 0:
+            return
+
+        payer = mango.CombinableInstructions.from_wallet(self.wallet)
+        crank = self.build_crank_instructions()
+        settle = self.market_instruction_builder.build_settle_instructions()
+        transaction_ids = (payer + changes + crank + settle).execute(self.context)
+        self._logger.info("Transaction IDs: %s.", transaction_ids)
+
+    def build_crank_instructions(self, limit: Decimal = Decimal(32)) -> mango.CombinableInstructions:
+        # Serum's consume-events stops at the first event whose open orders account isn't passed in, so
+        # the crank has to list the owners of the events actually waiting on the queue.
+        open_orders_to_crank: typing.List[PublicKey] = []
+        for event in self.market.unprocessed_events(self.context):
+            open_orders_to_crank += [event.public_key]
+
+        if len(open_orders_to_crank) == 0:
+            return mango.CombinableInstructions.empty()
+
+        return self.market_instruction_builder.build_crank_instructions(open_orders_to_crank, limit)
 
     def fetch_inventory(self) -> typing.Sequence[typing.Optional[mango.InstrumentValue]]:
         if self.market.inventory_source == mango.InventorySource.SPL_TOKENS:
@@ -152,8 +196,10 @@ class SimpleMarketMaker:
             return account.net_values_by_index
 
     def calculate_order_prices(self, price: mango.Price) -> typing.Tuple[Decimal, Decimal]:
-        bid = price.mid_price - (price.mid_price * self.spread_ratio)
-        ask = price.mid_price + (price.mid_price * self.spread_ratio)
+        mid_price: Decimal = price.mid_price
+        spread: Decimal = mid_price * self.spread_ratio
+        bid = mid_price - spread
+        ask = mid_price + spread
 
         return (bid, ask)
 
@@ -174,15 +220,17 @@ class SimpleMarketMaker:
 
     def orders_require_action(self, orders: typing.Sequence[mango.Order], price: Decimal, quantity: Decimal) -> bool:
         def within_tolerance(target_value: Decimal, order_value: Decimal, tolerance: Decimal) -> bool:
-            tolerated = order_value * tolerance
-            return bool((order_value < (target_value + tolerated)) and (order_value > (target_value - tolerated)))
-        return len(orders) == 0 or not all([(within_tolerance(price, order.price, self.existing_order_tolerance)) and within_tolerance(quantity, order.quantity, self.existing_order_tolerance) for order in orders])
+            return abs(order_value - target_value) < order_value * tolerance
+
+        # A generator rather than a list, so `all()` stops at the first order that is out of tolerance.
+        tolerance: Decimal = self.existing_order_tolerance
+        return len(orders) == 0 or not all(within_tolerance(price, order.price, tolerance) and within_tolerance(quantity, order.quantity, tolerance) for order in orders)
 
     def update_health_on_successful_iteration(self) -> None:
         try:
             Path(self.health_filename).touch(mode=0o666, exist_ok=True)
         except Exception as exception:
-            self._logger.warning(f"Touching file '{self.health_filename}' raised exception: {exception}")
+            self._logger.warning("Touching file '%s' raised exception: %s", self.health_filename, exception)
 
     def __str__(self) -> str:
         return f"""« SimpleMarketMaker for market '{self.market.symbol}' »"""
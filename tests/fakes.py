@@ -1,5 +1,6 @@
 import construct
 import datetime
+import functools
 import mango
 import mango.marketmaking
 import typing
@@ -64,6 +65,13 @@ def fake_context() -> mango.Context:
     return context
 
 
+# Looking a token up builds a whole fake Context and scans the ids.json groups, so each symbol is only
+# looked up once and the resulting Token is shared.
+@functools.lru_cache(maxsize=None)
+def fake_lookup_token(symbol: str) -> mango.Token:
+    return mango.Token.ensure(fake_context().instrument_lookup.find_by_symbol_or_raise(symbol))
+
+
 def fake_account_info(address: PublicKey = fake_public_key(), executable: bool = False, lamports: Decimal = Decimal(0), owner: PublicKey = fake_public_key(), rent_epoch: Decimal = Decimal(0), data: bytes = bytes([0])) -> mango.AccountInfo:
     return mango.AccountInfo(address, executable, lamports, owner, rent_epoch, data)
 
@@ -193,36 +201,40 @@ def fake_root_bank_cache() -> mango.RootBankCache:
     return mango.RootBankCache(Decimal(1), Decimal(2), datetime.datetime.now())
 
 
+# The seeded keys in a fake Group never change, so they're derived once rather than on every call.
+_FAKE_GROUP_ROOT_BANK: PublicKey = fake_seeded_public_key("root bank")
+_FAKE_GROUP_SIGNER_KEY: PublicKey = fake_seeded_public_key("signer key")
+_FAKE_GROUP_ADMIN_KEY: PublicKey = fake_seeded_public_key("admin key")
+_FAKE_GROUP_SERUM_PROGRAM_ADDRESS: PublicKey = fake_seeded_public_key("DEX program ID")
+_FAKE_GROUP_CACHE_KEY: PublicKey = fake_seeded_public_key("cache key")
+_FAKE_GROUP_INSURANCE_VAULT: PublicKey = fake_seeded_public_key("insurance vault")
+_FAKE_GROUP_SRM_VAULT: PublicKey = fake_seeded_public_key("srm vault")
+_FAKE_GROUP_MSRM_VAULT: PublicKey = fake_seeded_public_key("msrm vault")
+_FAKE_GROUP_FEES_VAULT: PublicKey = fake_seeded_public_key("fees vault")
+
+
 def fake_group() -> mango.Group:
     account_info = fake_account_info()
     name = "FAKE_GROUP"
     meta_data = mango.Metadata(mango.layouts.DATA_TYPE.Group, mango.Version.V1, True)
-    instrument_lookup = fake_context().instrument_lookup
-    usdc = mango.Token.ensure(instrument_lookup.find_by_symbol_or_raise("usdc"))
-    quote_info = mango.TokenBank(usdc, fake_seeded_public_key("root bank"))
+    usdc = fake_lookup_token("USDC")
+    quote_info = mango.TokenBank(usdc, _FAKE_GROUP_ROOT_BANK)
     signer_nonce = Decimal(1)
-    signer_key = fake_seeded_public_key("signer key")
-    admin_key = fake_seeded_public_key("admin key")
-    serum_program_address = fake_seeded_public_key("DEX program ID")
-    cache_key = fake_seeded_public_key("cache key")
     valid_interval = Decimal(7)
-    insurance_vault = fake_seeded_public_key("insurance vault")
-    srm_vault = fake_seeded_public_key("srm vault")
-    msrm_vault = fake_seeded_public_key("msrm vault")
-    fees_vault = fake_seeded_public_key("fees vault")
 
     return mango.Group(account_info, mango.Version.V1, name, meta_data, quote_info, [], [],
-                       signer_nonce, signer_key, admin_key, serum_program_address, cache_key,
-                       valid_interval, insurance_vault, srm_vault, msrm_vault, fees_vault)
+                       signer_nonce, _FAKE_GROUP_SIGNER_KEY, _FAKE_GROUP_ADMIN_KEY,
+                       _FAKE_GROUP_SERUM_PROGRAM_ADDRESS, _FAKE_GROUP_CACHE_KEY, valid_interval,
+                       _FAKE_GROUP_INSURANCE_VAULT, _FAKE_GROUP_SRM_VAULT, _FAKE_GROUP_MSRM_VAULT,
+                       _FAKE_GROUP_FEES_VAULT)
 
 
 def fake_prices(prices: typing.Sequence[str]) -> typing.Sequence[mango.InstrumentValue]:
-    instrument_lookup = fake_context().instrument_lookup
-    ETH = mango.Token.ensure(instrument_lookup.find_by_symbol_or_raise("ETH"))
-    BTC = mango.Token.ensure(instrument_lookup.find_by_symbol_or_raise("BTC"))
-    SOL = mango.Token.ensure(instrument_lookup.find_by_symbol_or_raise("SOL"))
-    SRM = mango.Token.ensure(instrument_lookup.find_by_symbol_or_raise("SRM"))
-    USDC = mango.Token.ensure(instrument_lookup.find_by_symbol_or_raise("USDC"))
+    ETH = fake_lookup_token("ETH")
+    BTC = fake_lookup_token("BTC")
+    SOL = fake_lookup_token("SOL")
+    SRM = fake_lookup_token("SRM")
+    USDC = fake_lookup_token("USDC")
     eth, btc, sol, srm, usdc = prices
 
     return [
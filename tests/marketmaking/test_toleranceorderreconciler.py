@@ -226,3 +226,35 @@ def test_reconcile_two_acceptable_two_unacceptable_orders() -> None:
     # Desired 4 outcomes
     assert result.to_place[1] == desired[3]
     assert result.to_cancel[1] == existing[3]
+
+
+def test_reconcile_vectorised_matching_gives_same_outcomes() -> None:
+    existing = [
+        mango.Order.from_basic_info(mango.Side.BUY, price=Decimal(98), quantity=Decimal(20)),
+        mango.Order.from_basic_info(mango.Side.BUY, price=Decimal(99), quantity=Decimal(10)),
+        mango.Order.from_basic_info(mango.Side.BUY, price=Decimal(99), quantity=Decimal(10)),
+        mango.Order.from_basic_info(mango.Side.SELL, price=Decimal(101), quantity=Decimal(10)),
+        mango.Order.from_basic_info(mango.Side.SELL, price=Decimal(102), quantity=Decimal(20))
+    ]
+    desired = [
+        mango.Order.from_basic_info(mango.Side.BUY, price=Decimal("99.099"), quantity=Decimal(10)),
+        mango.Order.from_basic_info(mango.Side.BUY, price=Decimal("98.1"), quantity=Decimal(20)),
+        mango.Order.from_basic_info(mango.Side.SELL, price=Decimal("101.102"), quantity=Decimal(10)),
+        mango.Order.from_basic_info(mango.Side.BUY, price=Decimal("98.901"), quantity=Decimal("9.99")),
+        mango.Order.from_basic_info(mango.Side.SELL, price=Decimal("102.102"), quantity=Decimal("20.02"))
+    ]
+    model_state = fake_model_state()
+    unvectorised = ToleranceOrderReconciler(Decimal("0.001"), Decimal("0.001"))
+    vectorised = ToleranceOrderReconciler(Decimal("0.001"), Decimal("0.001"))
+    vectorised.vectorised_matching_threshold = 0
+
+    expected = unvectorised.reconcile(model_state, existing, desired)
+    result = vectorised.reconcile(model_state, existing, desired)
+
+    assert result.to_place == expected.to_place
+    assert result.to_cancel == expected.to_cancel
+    assert result.to_keep == expected.to_keep
+    assert result.to_ignore == expected.to_ignore
+    assert result.to_place == [desired[1], desired[2]]
+    assert result.to_cancel == [existing[0], existing[3]]
+    assert result.to_keep == [existing[1], existing[2], existing[4]]
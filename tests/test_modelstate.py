@@ -0,0 +1,46 @@
+import typing
+
+from .context import mango
+from .fakes import fake_model_state, fake_order, fake_seeded_public_key
+
+from decimal import Decimal
+
+
+def test_current_orders_only_returns_owned_orders() -> None:
+    owner = fake_seeded_public_key("order owner")
+    other = fake_seeded_public_key("someone else")
+    owned_bid = fake_order(price=Decimal(99), side=mango.Side.BUY).with_owner(owner)
+    other_bid = fake_order(price=Decimal(98), side=mango.Side.BUY).with_owner(other)
+    owned_ask = fake_order(price=Decimal(101), side=mango.Side.SELL).with_owner(owner)
+    orderbook = mango.OrderBook("FAKE", mango.NullLotSizeConverter(), [owned_bid, other_bid], [owned_ask])
+    model_state = fake_model_state(order_owner=owner, orderbook=orderbook)
+
+    assert model_state.current_orders() == [owned_bid, owned_ask]
+
+
+def test_current_orders_cached_until_orderbook_changes() -> None:
+    owner = fake_seeded_public_key("order owner")
+    first_bid = fake_order(price=Decimal(99), side=mango.Side.BUY).with_owner(owner)
+    orderbook = mango.OrderBook("FAKE", mango.NullLotSizeConverter(), [first_bid], [])
+    model_state = fake_model_state(order_owner=owner, orderbook=orderbook)
+
+    first = model_state.current_orders()
+    assert first == [first_bid]
+
+    # Nothing changed, so the same list comes back without being rebuilt.
+    assert model_state.current_orders() is first
+
+    # A websocket update replaces the sides on the same OrderBook object.
+    second_bid = fake_order(price=Decimal(98), side=mango.Side.BUY).with_owner(owner)
+    orderbook.bids = [second_bid]
+    second = model_state.current_orders()
+    assert second == [second_bid]
+    assert model_state.current_orders() is second
+
+    # A whole new OrderBook pushed through the watcher is picked up too.
+    ask = fake_order(price=Decimal(101), side=mango.Side.SELL).with_owner(owner)
+    watcher = typing.cast(mango.ManualUpdateWatcher[mango.OrderBook], model_state.orderbook_watcher)
+    watcher.value = mango.OrderBook("FAKE", mango.NullLotSizeConverter(), [], [ask])
+    third = model_state.current_orders()
+    assert third == [ask]
+    assert model_state.current_orders() is third
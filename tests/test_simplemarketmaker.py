@@ -0,0 +1,187 @@
+import rx
+import typing
+
+from .context import mango
+from .fakes import fake_context, fake_order, fake_price, fake_seeded_public_key, fake_token, fake_wallet, MockClient
+
+from datetime import timedelta
+from decimal import Decimal
+from solana.keypair import Keypair
+from solana.publickey import PublicKey
+from solana.rpc.types import TxOpts
+from solana.transaction import Transaction, TransactionInstruction
+
+from mango.simplemarketmaking.simplemarketmaker import SimpleMarketMaker
+
+
+class RecordingClient(MockClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.sent: typing.List[Transaction] = []
+
+    def send_transaction(self, transaction: Transaction, *signers: Keypair, opts: TxOpts = TxOpts()) -> str:
+        self.sent += [transaction]
+        return f"signature {len(self.sent)}"
+
+
+class StubEvent:
+    def __init__(self, public_key: PublicKey) -> None:
+        self.public_key: PublicKey = public_key
+
+
+class StubMarket:
+    def __init__(self, events: typing.Sequence[StubEvent]) -> None:
+        self.symbol: str = "BASE/QUOTE"
+        self.base: mango.Token = fake_token("BASE")
+        self.quote: mango.Token = fake_token("QUOTE")
+        self.events: typing.Sequence[StubEvent] = events
+
+    def unprocessed_events(self, context: mango.Context) -> typing.Sequence[StubEvent]:
+        return self.events
+
+
+class StubMarketOperations(mango.NullMarketOperations):
+    def __init__(self, orders: typing.Sequence[mango.Order]) -> None:
+        super().__init__("BASE/QUOTE")
+        self.orders: typing.Sequence[mango.Order] = orders
+
+    def load_my_orders(self) -> typing.Sequence[mango.Order]:
+        return self.orders
+
+
+class StubMarketInstructionBuilder(mango.NullMarketInstructionBuilder):
+    def __init__(self) -> None:
+        super().__init__("BASE/QUOTE")
+        self.cranked: typing.List[PublicKey] = []
+
+    def build_cancel_order_instructions(self, order: mango.Order, ok_if_missing: bool = False) -> mango.CombinableInstructions:
+        return self.__instruction(b"cancel")
+
+    def build_place_order_instructions(self, order: mango.Order) -> mango.CombinableInstructions:
+        return self.__instruction(b"place")
+
+    def build_settle_instructions(self) -> mango.CombinableInstructions:
+        return self.__instruction(b"settle")
+
+    def build_crank_instructions(self, addresses_to_crank: typing.Sequence[PublicKey], limit: Decimal = Decimal(32)) -> mango.CombinableInstructions:
+        self.cranked += addresses_to_crank
+        return self.__instruction(b"crank")
+
+    def __instruction(self, data: bytes) -> mango.CombinableInstructions:
+        return mango.CombinableInstructions.from_instruction(
+            TransactionInstruction(keys=[], program_id=fake_seeded_public_key("program ID"), data=data))
+
+
+# Like `SerumMarketInstructionBuilder`, this creates the OpenOrders account on the first place if there
+# isn't one yet, and only then knows its address.
+class OpenOrdersTrackingInstructionBuilder(StubMarketInstructionBuilder):
+    def __init__(self) -> None:
+        super().__init__()
+        self.open_orders_address: typing.Optional[PublicKey] = None
+        self.placed: typing.List[mango.Order] = []
+
+    def build_cancel_order_instructions(self, order: mango.Order, ok_if_missing: bool = False) -> mango.CombinableInstructions:
+        self.placed = [placed for placed in self.placed if placed.client_id != order.client_id]
+        return super().build_cancel_order_instructions(order, ok_if_missing)
+
+    def build_place_order_instructions(self, order: mango.Order) -> mango.CombinableInstructions:
+        if self.open_orders_address is None:
+            self.open_orders_address = fake_seeded_public_key("created open orders")
+        self.placed += [order.with_owner(self.open_orders_address)]
+        return super().build_place_order_instructions(order)
+
+
+class OrderBookFromBuilderMarketOperations(mango.SerumMarketOperations):
+    def load_orderbook(self) -> mango.OrderBook:
+        builder = typing.cast(OpenOrdersTrackingInstructionBuilder, self.market_instruction_builder)
+        bids = [order for order in builder.placed if order.side == mango.Side.BUY]
+        asks = [order for order in builder.placed if order.side == mango.Side.SELL]
+        return mango.OrderBook("BASE/QUOTE", mango.NullLotSizeConverter(), bids, asks)
+
+
+class StubOracle(mango.Oracle):
+    def __init__(self, market: mango.Market) -> None:
+        super().__init__("Stub Oracle", market)
+
+    def fetch_price(self, context: mango.Context) -> mango.Price:
+        return fake_price()
+
+    def to_streaming_observable(self, context: mango.Context) -> rx.core.typing.Observable[mango.Price]:
+        return rx.of(fake_price())
+
+
+class LimitedIterationsSimpleMarketMaker(SimpleMarketMaker):
+    iterations: int = 1
+
+    def fetch_inventory(self) -> typing.Sequence[typing.Optional[mango.InstrumentValue]]:
+        return [mango.InstrumentValue(self.market.base, Decimal(10)), mango.InstrumentValue(self.market.quote, Decimal(1000))]
+
+    def update_health_on_successful_iteration(self) -> None:
+        self.iterations -= 1
+        self.stop_requested = self.iterations == 0
+
+
+def _sent_data(transaction: Transaction) -> typing.Sequence[bytes]:
+    return [instruction.data for instruction in transaction.instructions]
+
+
+def test_iteration_sends_cancels_and_places_in_single_execute() -> None:
+    context = fake_context()
+    client = RecordingClient()
+    context.client = client
+    events = [StubEvent(fake_seeded_public_key("open orders 1")), StubEvent(fake_seeded_public_key("open orders 2"))]
+    market = StubMarket(events)
+    existing_orders = [fake_order(price=Decimal(50), side=mango.Side.BUY),
+                       fake_order(price=Decimal(150), side=mango.Side.SELL)]
+    market_operations = StubMarketOperations(existing_orders)
+    builder = StubMarketInstructionBuilder()
+    actual = LimitedIterationsSimpleMarketMaker(context, fake_wallet(), market, market_operations,  # type: ignore[arg-type]
+                                                StubOracle(mango.DryRunMarket("BASE/QUOTE")), Decimal("0.01"),
+                                                Decimal("0.1"), Decimal("0.001"), timedelta(seconds=0), builder)
+
+    actual.start()
+
+    # Startup cleanup, the single iteration, and the cleanup after stopping.
+    assert len(client.sent) == 3
+    assert _sent_data(client.sent[1]) == [b"cancel", b"place", b"cancel", b"place", b"crank", b"settle"]
+    assert builder.cranked[0:2] == [event.public_key for event in events]
+
+
+def test_orders_placed_through_shared_builder_are_found_next_iteration() -> None:
+    context = fake_context()
+    client = RecordingClient()
+    context.client = client
+    market = StubMarket([])
+    builder = OpenOrdersTrackingInstructionBuilder()
+    market_operations = OrderBookFromBuilderMarketOperations(context, fake_wallet(), market,  # type: ignore[arg-type]
+                                                             builder)  # type: ignore[arg-type]
+    actual = LimitedIterationsSimpleMarketMaker(context, fake_wallet(), market, market_operations,  # type: ignore[arg-type]
+                                                StubOracle(mango.DryRunMarket("BASE/QUOTE")), Decimal("0.01"),
+                                                Decimal("0.1"), Decimal("0.001"), timedelta(seconds=0),
+                                                market_operations.market_instruction_builder)
+    actual.iterations = 2
+
+    actual.start()
+
+    # No orders to clean up at startup, both orders placed in the first iteration, nothing to change in the
+    # second, then both orders cancelled when stopping.
+    assert len(client.sent) == 2
+    assert _sent_data(client.sent[0]) == [b"place", b"place", b"settle"]
+    assert _sent_data(client.sent[1]) == [b"cancel", b"cancel", b"settle"]
+    assert builder.placed == []
+
+
+def test_empty_changes_send_nothing() -> None:
+    context = fake_context()
+    client = RecordingClient()
+    context.client = client
+    builder = StubMarketInstructionBuilder()
+    actual = SimpleMarketMaker(context, fake_wallet(), StubMarket([]), StubMarketOperations([]),  # type: ignore[arg-type]
+                               StubOracle(mango.DryRunMarket("BASE/QUOTE")), Decimal("0.01"),
+                               Decimal("0.1"), Decimal("0.001"), timedelta(seconds=0), builder)
+
+    actual.execute_changes(mango.CombinableInstructions.empty())
+    actual.cleanup()
+
+    assert len(client.sent) == 0
+    assert len(builder.cranked) == 0